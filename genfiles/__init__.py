@@ -0,0 +1,27 @@
+# ==================================================================================
+# genfiles/__init__.py
+
+# --- Metadata ---
+_AUTHOR = "Igor Brzezek"
+_DATE = "09.12.2025"
+_EMAIL = "igor.brzezek@gmail.com"
+_GITHUB = "https://github.com/igorbrzezek/genfiles"
+_VERSION = "1.0.2"
+# -----------------
+
+from genfiles.core import (
+    generate_random_data,
+    create_files_simple,
+    create_structured_files,
+    print_structured_statistics,
+    print_simple_statistics,
+)
+
+__all__ = [
+    'generate_random_data',
+    'create_files_simple',
+    'create_structured_files',
+    'print_structured_statistics',
+    'print_simple_statistics',
+]
+# ==================================================================================
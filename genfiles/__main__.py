@@ -0,0 +1,196 @@
+# ==================================================================================
+# genfiles/__main__.py
+
+import argparse
+from typing import Optional
+
+from genfiles import _AUTHOR, _EMAIL, _GITHUB, _VERSION
+from genfiles.core import (
+    _BUNDLE_NAME,
+    create_files_simple,
+    create_structured_files,
+    print_simple_statistics,
+    print_structured_statistics,
+)
+
+
+def main(args: Optional[list] = None) -> None:
+    """Main function to parse arguments and run file creation."""
+    parser = argparse.ArgumentParser(
+        prog='python -m genfiles',
+        description=f"Generates a directory and file structure for testing purposes.\nVersion: {_VERSION}\nAuthor: {_AUTHOR} ({_EMAIL})\nGitHub: {_GITHUB}",
+        formatter_class=argparse.RawTextHelpFormatter # For better description formatting
+    )
+    
+    # --- Directory Option (Required for both modes) ---
+    parser.add_argument(
+        '-d', '--directory',
+        type=str,
+        required=True,
+        help="Name of the root directory to be created (required)."
+    )
+    
+    # --- Simple File Creation Mode (Mutually Exclusive Group 1) ---
+    # This mode overrides the structure creation options.
+    simple_group = parser.add_argument_group('Simple Creation Mode (Overrides Structure)')
+    simple_group.add_argument(
+        '-fc', '--file-create',
+        type=int,
+        nargs=2,
+        metavar=('N', 'M'),
+        help="Simple file creation mode: Create N binary files, each of size M kilobytes (KB). N is file count, M is size in KB. (Overrides -n, -m, -k, --bin, --txt, --mix)"
+    )
+    simple_group.add_argument(
+        '--insecure-reuse',
+        action='store_true',
+        help="Generate random data once and write the same content to every file (Simple Mode).\nFaster, but the files are identical - unsuitable where content must differ (e.g. deduplicating or compressing storage)."
+    )
+
+    # --- Structured Creation Mode Options (Mutually Exclusive Group 2) ---
+    structure_group = parser.add_argument_group('Structured Creation Mode (Default)')
+    structure_group.add_argument(
+        '-n',
+        type=int,
+        help="Number N of subdirectories to create (e.g., 10). Required only in structured mode."
+    )
+    structure_group.add_argument(
+        '-m', '--max-files',
+        type=int,
+        help="Maximum number M of files (from 1 to M) in each subdirectory (e.g., 5). Required only in structured mode.",
+        dest='max_files' # 'max_files' as dest
+    )
+    structure_group.add_argument(
+        '-k', '--max-size-kb',
+        type=int,
+        help="Maximum size K of files in kilobytes (KB) (e.g., 1024). Required only in structured mode.",
+        dest='max_size_kb' # 'max_size_kb' as dest
+    )
+    
+    # File Type Options
+    type_group = structure_group.add_mutually_exclusive_group()
+    type_group.add_argument(
+        '--bin',
+        action='store_const',
+        const='bin',
+        dest='file_type',
+        help="Generate only binary files (Structured Mode)."
+    )
+    type_group.add_argument(
+        '--txt',
+        action='store_const',
+        const='txt',
+        dest='file_type',
+        help="Generate only text files (Structured Mode)."
+    )
+    type_group.add_argument(
+        '--mix',
+        action='store_const',
+        const='mix',
+        dest='file_type',
+        default='mix',
+        help="Generate a mix of binary and text files (approx. 50/50 - default in Structured Mode)."
+    )
+    structure_group.add_argument(
+        '--aggregate',
+        action='store_true',
+        help=f"Store the files of each subdirectory in a single '{_BUNDLE_NAME}' archive instead of separate files (Structured Mode).\nMuch less filesystem metadata work for many small files, but consumers must read the files from the archive."
+    )
+
+    # Statistics Option
+    parser.add_argument(
+        '--stat',
+        action='store_true',
+        help="Show statistics on the generated files (count, total size, average size)."
+    )
+
+    # Parallelism Option
+    structure_group.add_argument(
+        '-p', '--processes',
+        type=int,
+        default=1,
+        help="Number of worker processes building subdirectories in parallel (Structured Mode, default: 1)."
+    )
+
+    # Randomness Option
+    parser.add_argument(
+        '--secure',
+        action='store_true',
+        help="Generate all file content with os.urandom() (cryptographically secure).\nBy default, NumPy's PCG64 pseudo-random generator is used when NumPy is installed:\nabout twice as fast, but its output is predictable - do not rely on it where unpredictability matters.\nSimple Mode files of 1 MB or more are always read from /dev/urandom, with or without this flag."
+    )
+
+    # Verbosity Option
+    parser.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        help="Print a line for every created subdirectory and file (errors are always printed)."
+    )
+    
+    # Parse arguments
+    if args:
+        parsed_args = parser.parse_args(args)
+    else:
+        parsed_args = parser.parse_args()
+
+    # --- Determine Mode and Validation ---
+    
+    is_simple_mode = parsed_args.file_create is not None
+    
+    if is_simple_mode:
+        N_files, M_size_kb = parsed_args.file_create
+        
+        if N_files <= 0 or M_size_kb <= 0:
+            parser.error("For --file-create, both N (file count) and M (size in KB) must be integers greater than 0.")
+            
+        # Run Simple Mode
+        try:
+            stats = create_files_simple(
+                root_dir=parsed_args.directory,
+                num_files=N_files,
+                size_kb=M_size_kb,
+                verbose=parsed_args.verbose,
+                reuse=parsed_args.insecure_reuse,
+                secure=parsed_args.secure
+            )
+            print(f"\nFinished successfully. Created files in directory: {parsed_args.directory}")
+            if parsed_args.stat:
+                print_simple_statistics(stats)
+        except Exception as e:
+            print(f"\nAn error occurred during simple file creation: {e}")
+
+    else:
+        # Structured Mode Validation 
+        if parsed_args.n is None or parsed_args.max_files is None or parsed_args.max_size_kb is None:
+             parser.error("When --file-create is not used, -n, -m, and -k are required for structured generation.")
+             
+        if parsed_args.n <= 0:
+            parser.error("-n must be an integer greater than 0.")
+        if parsed_args.max_files <= 0:
+            parser.error("-m/--max-files must be an integer greater than 0.")
+        if parsed_args.max_size_kb <= 0:
+            parser.error("-k/--max-size-kb must be an integer greater than 0.")
+        if parsed_args.processes <= 0:
+            parser.error("-p/--processes must be an integer greater than 0.")
+        
+        # Run Structured Mode
+        try:
+            stats = create_structured_files(
+                root_dir=parsed_args.directory,
+                N=parsed_args.n,
+                M=parsed_args.max_files,
+                K=parsed_args.max_size_kb,
+                file_type=parsed_args.file_type if parsed_args.file_type else 'mix',
+                aggregate=parsed_args.aggregate,
+                verbose=parsed_args.verbose,
+                processes=parsed_args.processes,
+                secure=parsed_args.secure
+            )
+            print(f"\nFinished successfully. Structure created in directory: {parsed_args.directory}")
+            if parsed_args.stat:
+                print_structured_statistics(stats)
+                
+        except Exception as e:
+            print(f"\nAn error occurred during structured file generation: {e}")
+
+if __name__ == "__main__":
+    main()
+# ==================================================================================
@@ -0,0 +1,912 @@
+# ==================================================================================
+# genfiles/core.py
+
+import array
+import contextlib
+import errno
+import io
+import itertools
+import mmap
+import os
+import random
+import string
+import sys
+import threading
+import time
+from typing import Optional, Callable, Dict, Any, Iterable, Iterator, List, Tuple
+
+# Optional modules are imported on first use, so that importing this module
+# stays cheap for embedding code (NumPy alone takes tens of milliseconds):
+# - liburing: batched writes through io_uring on Linux (pip install liburing),
+#   imported by _UringWriter.create()
+# - numpy: faster pseudo-random source for file content (pip install numpy),
+#   imported by _np_rng()
+liburing = None
+
+# Alphabet for text files: ASCII letters, digits and whitespace (65 characters)
+_ALPHABET = (string.ascii_letters + string.digits + ' \n\t').encode('ascii')
+# Maps every possible byte value onto the alphabet, so random bytes can be
+# turned into random text with a single bytes.translate() call
+_XLATE = bytes(_ALPHABET[b % len(_ALPHABET)] for b in range(256))
+
+# Default capacity of the random byte pool (4 MiB)
+_POOL_SIZE = 4 * 1024 * 1024
+
+# Number of threads generating and writing files concurrently
+_MAX_WORKERS = (os.cpu_count() or 1) * 4
+
+# Number of files submitted to io_uring per system call (3 queue entries each)
+_URING_BATCH = 64
+# A batch is also submitted once its files hold this many bytes
+_URING_BATCH_BYTES = _POOL_SIZE
+# Largest single write the kernel performs (MAX_RW_COUNT); bigger files
+# are written synchronously instead
+_URING_MAX_WRITE = 0x7ffff000
+
+# Simple mode files of at least this size are written with O_DIRECT (Linux)
+# or, where that is unavailable, through a memory mapping
+_LARGE_FILE_SIZE = 1 << 20
+_HAS_DIRECT = sys.platform.startswith('linux') and hasattr(os, 'O_DIRECT')
+# Combined size of the per-thread buffers for large files; limits the number
+# of threads writing them at once
+_LARGE_BUFFER_BUDGET = 128 * 1024 * 1024
+
+# /dev/urandom, kept open for reading random bytes into reusable buffers
+_URANDOM_FD = None
+if os.name == 'posix':
+    try:
+        _URANDOM_FD = os.open('/dev/urandom', os.O_RDONLY)
+    except OSError:
+        pass
+
+# Large binary files are preferably streamed from /dev/urandom with sendfile()
+# (Linux), in chunks of this size
+_SENDFILE_CHUNK = 1 << 20
+_HAS_SENDFILE = (
+    sys.platform.startswith('linux') and hasattr(os, 'sendfile') and _URANDOM_FD is not None
+)
+
+# Alignment required by O_DIRECT for buffers, offsets and lengths
+_BLOCK_SIZE = 4096
+
+# Regular writes hand the data to os.writev() as slices of this size,
+# at most IOV_MAX of them per call
+_WRITEV_CHUNK = 1 << 20
+_IOV_MAX = 1024
+if hasattr(os, 'sysconf'):
+    try:
+        _IOV_MAX = os.sysconf('SC_IOV_MAX')
+    except (ValueError, OSError):
+        pass
+
+# Aggregated mode: name of the archive holding a subdirectory's files
+_BUNDLE_NAME = "bundle.tar"
+
+# Structured mode statistics: counters are kept in an array at these indices
+# and returned as a dict with these keys
+_STATS_KEYS = (
+    'total_files', 'binary_files', 'text_files',
+    'total_size_bytes', 'binary_size_bytes', 'text_size_bytes',
+)
+_IDX_TOTAL_FILES, _IDX_BIN_FILES, _IDX_TXT_FILES = 0, 1, 2
+_IDX_TOTAL_SIZE, _IDX_BIN_SIZE, _IDX_TXT_SIZE = 3, 4, 5
+
+# File name extensions by type
+_EXT_BIN = ".bin"
+_EXT_TXT = ".txt"
+
+# Progress messages are buffered and written to stdout in chunks
+_LOG_FLUSH_EVERY = 256
+_log_buf: List[str] = []
+
+
+class _RandPool:
+    """
+    Serves random bytes from a buffer refilled in bulk with os.urandom(),
+    so many small files cost one system call instead of one each.
+    Slices handed out are disjoint, but they come from shared refills.
+    """
+
+    def __init__(self, cap: int = _POOL_SIZE):
+        self.cap = cap
+        self.buf = b''
+        self.pos = 0
+        self.lock = threading.Lock()
+
+    def take(self, n: int) -> bytes:
+        """Returns n random bytes."""
+        # Large requests bypass the pool entirely
+        if n >= self.cap:
+            return os.urandom(n)
+        with self.lock:
+            if len(self.buf) - self.pos < n:
+                self.buf = os.urandom(self.cap)
+                self.pos = 0
+            out = self.buf[self.pos:self.pos + n]
+            self.pos += n
+        return out
+
+
+_POOL = _RandPool()
+
+# Pseudo-random generator (PCG64) for file content, created by _np_rng()
+_NP_RNG = None
+_NP_CHECKED = False
+
+
+def _np_rng() -> Optional[Any]:
+    """
+    Returns NumPy's PCG64 generator, importing NumPy and creating the
+    generator on the first call. Returns None when NumPy is not installed.
+    """
+    global _NP_RNG, _NP_CHECKED
+    if not _NP_CHECKED:
+        try:
+            import numpy
+        except ImportError:
+            pass
+        else:
+            _NP_RNG = numpy.random.default_rng()
+        _NP_CHECKED = True
+    return _NP_RNG
+
+# Random text (ASCII characters) is mapped from random bytes.
+# The slight bias of the modulo mapping is irrelevant for test data.
+
+
+def _bin_pool(size_bytes: int) -> bytes:
+    """Generates random binary data from os.urandom (through the pool)."""
+    return _POOL.take(size_bytes)
+
+
+def _txt_pool(size_bytes: int) -> bytes:
+    """Generates random text data from os.urandom (through the pool)."""
+    return _POOL.take(size_bytes).translate(_XLATE)
+
+
+def _bin_numpy(size_bytes: int) -> bytes:
+    """Generates random binary data with NumPy's PCG64 generator."""
+    return _NP_RNG.bytes(size_bytes)
+
+
+def _txt_numpy(size_bytes: int) -> bytes:
+    """Generates random text data with NumPy's PCG64 generator."""
+    return _NP_RNG.bytes(size_bytes).translate(_XLATE)
+
+
+# (binary, text) pair of data generators, each taking a size in bytes
+_Generators = Tuple[Callable[[int], bytes], Callable[[int], bytes]]
+
+
+def _generators(secure: bool) -> _Generators:
+    """
+    Returns the (binary, text) generators to use. Test data needs no
+    cryptographic randomness, so NumPy's PCG64 is used where available (about
+    twice as fast as os.urandom); with `secure`, or without NumPy, os.urandom is used.
+    """
+    if secure or _np_rng() is None:
+        return _bin_pool, _txt_pool
+    return _bin_numpy, _txt_numpy
+
+
+def generate_random_data(size_bytes: int, is_binary: bool) -> bytes:
+    """
+    Generates random data of the specified size, either text or binary,
+    with the default (non-secure) generators.
+    """
+    gen_bin, gen_txt = _generators(secure=False)
+    return gen_bin(size_bytes) if is_binary else gen_txt(size_bytes)
+
+
+def _log(message: str) -> None:
+    """Buffers a progress message, flushing the buffer when it is full."""
+    _log_buf.append(message)
+    if len(_log_buf) >= _LOG_FLUSH_EVERY:
+        _flush_log()
+
+
+def _flush_log() -> None:
+    """Writes all buffered progress messages to stdout."""
+    if _log_buf:
+        sys.stdout.write('\n'.join(_log_buf) + '\n')
+        _log_buf.clear()
+
+
+def _preallocate(fd: int, size: int) -> None:
+    """Reserves size bytes for the file up front, where the platform supports it."""
+    if size > 0 and hasattr(os, 'posix_fallocate'):
+        try:
+            os.posix_fallocate(fd, 0, size)
+        except OSError:
+            # Only an optimization; unsupported filesystems just grow the file
+            pass
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """
+    Writes all of data to fd. Where os.writev() exists, the data is passed
+    as zero-copy slices, so large buffers go out in one system call.
+    """
+    with memoryview(data) as view:
+        written = 0
+        while written < len(view):
+            if hasattr(os, 'writev'):
+                end = min(len(view), written + _WRITEV_CHUNK * _IOV_MAX)
+                chunks = [view[o:o + _WRITEV_CHUNK] for o in range(written, end, _WRITEV_CHUNK)]
+                written += os.writev(fd, chunks)
+            else:
+                written += os.write(fd, view[written:])
+
+
+def _write_file(file_path: str, data: bytes) -> None:
+    """Writes data to a new file, preallocating its full size first."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(file_path, flags, 0o666)
+    try:
+        _preallocate(fd, len(data))
+        _write_all(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _direct_write(file_path: str, buf: mmap.mmap, size: int) -> None:
+    """
+    Writes the first `size` bytes of a page-aligned buffer from _thread_buffer()
+    with O_DIRECT, bypassing the page cache. The whole buffer (a block multiple)
+    is written and the file is truncated back to the exact length afterwards.
+    """
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DIRECT, 0o666)
+    try:
+        _preallocate(fd, size)
+        with memoryview(buf) as view:
+            written = 0
+            while written < len(view):
+                written += os.write(fd, view[written:])
+        os.ftruncate(fd, size)
+    finally:
+        os.close(fd)
+
+
+def _mmap_write(file_path: str, data: bytes) -> None:
+    """Writes data by sizing the file up front and copying into a shared mapping of it."""
+    flags = os.O_RDWR | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(file_path, flags, 0o666)
+    try:
+        _preallocate(fd, len(data))
+        os.ftruncate(fd, len(data))
+        with mmap.mmap(fd, len(data), access=mmap.ACCESS_WRITE) as mm:
+            mm[:] = data
+            mm.flush()
+    finally:
+        os.close(fd)
+
+
+def _large_write(file_path: str, buf: mmap.mmap, size: int) -> None:
+    """
+    Writes the first `size` bytes of a buffer from _thread_buffer() with
+    O_DIRECT where supported, otherwise through mmap.
+    """
+    if _HAS_DIRECT:
+        try:
+            _direct_write(file_path, buf, size)
+            return
+        except OSError as e:
+            # Filesystem without O_DIRECT support (e.g. tmpfs)
+            if e.errno != errno.EINVAL:
+                raise
+    with memoryview(buf) as view, view[:size] as data:
+        _mmap_write(file_path, data)
+
+
+_local = threading.local()
+
+
+def _thread_buffer(size: int) -> mmap.mmap:
+    """
+    Returns a page-aligned buffer of at least `size` bytes, padded to a block
+    multiple as O_DIRECT requires. It is owned by the calling thread and reused
+    across calls, so large files need no new allocation per file.
+    """
+    aligned_size = -(-size // _BLOCK_SIZE) * _BLOCK_SIZE
+    buf = getattr(_local, 'buf', None)
+    if buf is None or len(buf) != aligned_size:
+        if buf is not None:
+            buf.close()
+        # Anonymous mappings are page-aligned
+        buf = _local.buf = mmap.mmap(-1, aligned_size)
+    return buf
+
+
+def _urandom_into(buf: memoryview) -> None:
+    """Fills buf with random bytes in place, reading /dev/urandom where available."""
+    if _URANDOM_FD is None:
+        buf[:] = os.urandom(len(buf))
+        return
+    filled = 0
+    while filled < len(buf):
+        read = os.readv(_URANDOM_FD, [buf[filled:]])
+        if read == 0:
+            raise OSError(errno.EIO, "Unexpected end of data from /dev/urandom")
+        filled += read
+
+
+def _sendfile_write(file_path: str, size: int) -> None:
+    """
+    Fills a new file with size random bytes copied from /dev/urandom inside
+    the kernel, without generating the data in a Python buffer.
+    """
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        _preallocate(fd, size)
+        remaining = size
+        while remaining:
+            sent = os.sendfile(fd, _URANDOM_FD, None, min(remaining, _SENDFILE_CHUNK))
+            if sent == 0:
+                raise OSError(errno.EIO, "Unexpected end of data from /dev/urandom", file_path)
+            remaining -= sent
+    finally:
+        os.close(fd)
+
+
+def _make_one(
+    file_path: str, file_size: int, is_binary: bool, gens: _Generators,
+    large: bool = False, content: Optional[bytes] = None
+) -> Optional[IOError]:
+    """
+    Generates and writes a single file with the `gens` generators, or writes
+    `content` when given. Returns the error on failure, otherwise None.
+    """
+    gen_bin, gen_txt = gens
+    try:
+        if large:
+            if content is None and is_binary and _HAS_SENDFILE:
+                try:
+                    _sendfile_write(file_path, file_size)
+                    return None
+                except OSError as e:
+                    # Kernel without sendfile() support for /dev/urandom
+                    if e.errno not in (errno.EINVAL, errno.ENOSYS):
+                        raise
+            # Fill this thread's aligned buffer instead of allocating a new one
+            buf = _thread_buffer(file_size)
+            if content is not None:
+                buf[:file_size] = content
+            elif is_binary:
+                with memoryview(buf) as view, view[:file_size] as data:
+                    _urandom_into(data)
+            else:
+                buf[:file_size] = gen_txt(file_size)
+            _large_write(file_path, buf, file_size)
+        elif content is not None:
+            _write_file(file_path, content)
+        else:
+            _write_file(file_path, gen_bin(file_size) if is_binary else gen_txt(file_size))
+    except IOError as e:
+        return e
+    return None
+
+
+class _UringWriter:
+    """
+    Writes files through io_uring. Each file is an open, write and close
+    linked together on a registered file slot, and up to `max_batch` files
+    (or `max_bytes` of data) are submitted to the kernel with a single
+    system call.
+    """
+
+    def __init__(self, max_batch: int = _URING_BATCH, max_bytes: int = _URING_BATCH_BYTES):
+        self.max_batch = max_batch
+        self.max_bytes = max_bytes
+        self.ring = liburing.Ring()
+        self.cqe = liburing.Cqe()
+        liburing.io_uring_queue_init(max_batch * 3, self.ring)
+        try:
+            liburing.io_uring_register_files_sparse(self.ring, max_batch)
+        except Exception:
+            liburing.io_uring_queue_exit(self.ring)
+            raise
+        # (path, data, iovec) for every file of the current batch, indexed by slot;
+        # the iovec points into data, so both are kept until the batch completes
+        self.pending: List[Tuple[str, bytes, Any]] = []
+        self.pending_bytes = 0
+
+    @classmethod
+    def create(cls) -> Optional["_UringWriter"]:
+        """Returns a writer, or None when io_uring is not available here."""
+        global liburing
+        if not sys.platform.startswith('linux'):
+            return None
+        try:
+            import liburing
+        except ImportError:
+            return None
+        try:
+            return cls()
+        except Exception:
+            return None
+
+    def submit(self, file_path: str, data: bytes) -> List[Optional[IOError]]:
+        """Queues a file; returns the results of the batch once it is flushed."""
+        if len(data) > _URING_MAX_WRITE:
+            # Too large for one write: flush the batch first to keep the order
+            results = self.drain()
+            try:
+                _write_file(file_path, data)
+                results.append(None)
+            except IOError as e:
+                results.append(e)
+            return results
+
+        slot = len(self.pending)
+        # A vectored write takes memoryview slices without copying them
+        iovec = liburing.Iovec([data])
+        self.pending.append((file_path, data, iovec))
+        self.pending_bytes += len(data)
+
+        # user_data is slot * 3 + step (0: open, 1: write, 2: close)
+        sqe = liburing.io_uring_get_sqe(self.ring)
+        liburing.io_uring_prep_open_direct(
+            sqe, file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, slot, 0o666
+        )
+        liburing.io_uring_sqe_set_flags(sqe, liburing.IOSQE_IO_LINK)
+        liburing.io_uring_sqe_set_data64(sqe, slot * 3)
+
+        sqe = liburing.io_uring_get_sqe(self.ring)
+        liburing.io_uring_prep_writev(sqe, slot, iovec, 0)
+        liburing.io_uring_sqe_set_flags(
+            sqe, liburing.IOSQE_IO_LINK | liburing.IOSQE_FIXED_FILE
+        )
+        liburing.io_uring_sqe_set_data64(sqe, slot * 3 + 1)
+
+        sqe = liburing.io_uring_get_sqe(self.ring)
+        liburing.io_uring_prep_close_direct(sqe, slot)
+        liburing.io_uring_sqe_set_data64(sqe, slot * 3 + 2)
+
+        # Flushing by size too keeps at most max_bytes of file data alive
+        if len(self.pending) >= self.max_batch or self.pending_bytes >= self.max_bytes:
+            return self.drain()
+        return []
+
+    def drain(self) -> List[Optional[IOError]]:
+        """Submits the queued files and returns one result per file, in order."""
+        if not self.pending:
+            return []
+        errors: List[Optional[IOError]] = [None] * len(self.pending)
+        liburing.io_uring_submit(self.ring)
+        for _ in range(len(self.pending) * 3):
+            liburing.io_uring_wait_cqe(self.ring, self.cqe)
+            cqe = self.cqe[0]
+            slot, step = divmod(liburing.io_uring_cqe_get_data64(cqe), 3)
+            file_path, data, _ = self.pending[slot]
+            try:
+                res = cqe.res  # raises OSError if the operation failed
+            except OSError as e:
+                # Keep the first failure; entries linked after it report ECANCELED
+                if errors[slot] is None:
+                    errors[slot] = OSError(e.errno, e.strerror, file_path)
+            else:
+                if step == 1 and res != len(data) and errors[slot] is None:
+                    errors[slot] = OSError(
+                        errno.EIO, f"Short write ({res} of {len(data)} bytes)", file_path
+                    )
+            finally:
+                liburing.io_uring_cqe_seen(self.ring, cqe)
+        self.pending = []
+        self.pending_bytes = 0
+        return errors
+
+    def close(self) -> None:
+        liburing.io_uring_queue_exit(self.ring)
+
+
+def _generate_group(group: List[Tuple[str, int, bool]], gens: _Generators) -> Iterator[bytes]:
+    """
+    Generates the data of a group of files with one call per file type and
+    yields each file's slice of it, in order. Slices are memoryviews, so the
+    data is not copied again per file.
+    """
+    gen_bin, gen_txt = gens
+    bin_data = memoryview(gen_bin(sum(size for _, size, is_bin in group if is_bin)))
+    txt_data = memoryview(gen_txt(sum(size for _, size, is_bin in group if not is_bin)))
+    bin_offset = txt_offset = 0
+    for _, file_size, is_binary in group:
+        if is_binary:
+            yield bin_data[bin_offset:bin_offset + file_size]
+            bin_offset += file_size
+        else:
+            yield txt_data[txt_offset:txt_offset + file_size]
+            txt_offset += file_size
+
+
+def _generate_tasks(
+    tasks: Iterable[Tuple[str, int, bool]], gens: _Generators
+) -> Iterator[Tuple[Tuple[str, int, bool], bytes]]:
+    """
+    Yields (task, data) for every (path, size, is_binary) task. Consecutive
+    files of the same directory are generated together, up to _POOL_SIZE
+    bytes per group, so random data is drawn once per subdirectory rather
+    than once per file.
+    """
+    group: List[Tuple[str, int, bool]] = []
+    group_dir = None
+    group_bytes = 0
+    for task in tasks:
+        file_dir = os.path.dirname(task[0])
+        if group and (file_dir != group_dir or group_bytes + task[1] > _POOL_SIZE):
+            yield from zip(group, _generate_group(group, gens))
+            group = []
+            group_bytes = 0
+        group.append(task)
+        group_dir = file_dir
+        group_bytes += task[1]
+    if group:
+        yield from zip(group, _generate_group(group, gens))
+
+
+def _write_files(
+    tasks: Iterable[Tuple[str, int, bool]], gens: _Generators, large: bool = False,
+    content: Optional[bytes] = None
+) -> Iterator[Optional[IOError]]:
+    """
+    Generates data with `gens` and writes a file for every (path, size, is_binary) task.
+    Yields the error for each file (None on success), in task order.
+    With `large`, files are written by the thread pool, streamed from
+    /dev/urandom where possible and otherwise with _large_write().
+    With `content`, every file is written with it instead of new data.
+    """
+    writer = None if large else _UringWriter.create()
+    if writer is not None:
+        try:
+            if content is not None:
+                for file_path, _, _ in tasks:
+                    yield from writer.submit(file_path, content)
+            else:
+                for (file_path, _, _), data in _generate_tasks(tasks, gens):
+                    yield from writer.submit(file_path, data)
+            yield from writer.drain()
+        finally:
+            writer.close()
+        return
+
+    # Fallback: overlap blocking writes with a pool of threads
+    from concurrent.futures import ThreadPoolExecutor
+    max_workers = _MAX_WORKERS
+    if large and (content is not None or not _HAS_SENDFILE):
+        # Every thread holds a buffer of one file; keep them within the budget.
+        # sendfile() needs no buffer, so it keeps the full pool.
+        tasks = iter(tasks)
+        first = next(tasks, None)
+        if first is None:
+            return
+        max_workers = max(1, min(_MAX_WORKERS, _LARGE_BUFFER_BUDGET // first[1]))
+        tasks = itertools.chain([first], tasks)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(lambda task: _make_one(*task, gens, large=large, content=content), tasks)
+
+
+def _write_bundles(
+    tasks: Iterable[Tuple[str, int, bool]], gens: _Generators
+) -> Iterator[Optional[IOError]]:
+    """
+    Aggregated mode: generates the files of each subdirectory as members of
+    a single tar archive in that subdirectory, instead of separate files.
+    Yields the error for each file (None on success), in task order.
+    """
+    import tarfile
+    for subdir_path, group in itertools.groupby(tasks, key=lambda task: os.path.dirname(task[0])):
+        group = list(group)
+        try:
+            bundle_path = os.path.join(subdir_path, _BUNDLE_NAME)
+            # tarfile ignores bufsize outside stream modes, so buffer the file itself
+            with open(bundle_path, 'wb', buffering=1 << 20) as f, \
+                    tarfile.open(fileobj=f, mode='w') as tar:
+                mtime = time.time()
+                for (file_path, file_size, _), data in _generate_tasks(group, gens):
+                    info = tarfile.TarInfo(os.path.basename(file_path))
+                    info.size = file_size
+                    info.mtime = mtime
+                    tar.addfile(info, io.BytesIO(data))
+        except (IOError, tarfile.TarError) as e:
+            # A partially written archive is unusable: report the whole bundle
+            yield from [e] * len(group)
+            continue
+        yield from [None] * len(group)
+
+
+def _plan_files(
+    N: int, M: int, min_size_bytes: int, max_size_bytes: int, file_type: str
+) -> Tuple[List[int], List[int], List[bool]]:
+    """
+    Draws the number of files (1..M) for each of the N subdirectories, then
+    the size and type (True for binary) of every file. With NumPy, each of
+    these is drawn in a single vectorized call.
+    """
+    rng = _np_rng()
+    if rng is not None:
+        counts = rng.integers(1, M, endpoint=True, size=N).tolist()
+        total = sum(counts)
+        sizes = rng.integers(min_size_bytes, max_size_bytes, endpoint=True, size=total).tolist()
+        if file_type == 'mix':
+            types = (rng.random(total) < 0.5).tolist()
+        else:
+            types = [file_type == 'bin'] * total
+        return counts, sizes, types
+
+    # Random number of files in the range 1 to M
+    counts = [random.randint(1, M) for _ in range(N)]
+    total = sum(counts)
+    # Randomize file size
+    sizes = [random.randint(min_size_bytes, max_size_bytes) for _ in range(total)]
+    # Determine file type
+    if file_type == 'mix':
+        # One random bit per file, all drawn in a single call
+        bits = random.getrandbits(total)
+        types = [c == '1' for c in format(bits, f'0{total}b')]
+    else:
+        types = [file_type == 'bin'] * total
+    return counts, sizes, types
+
+
+def create_files_simple(
+    root_dir: str, num_files: int, size_kb: int, verbose: bool = False,
+    reuse: bool = False, secure: bool = False
+) -> Dict[str, Any]:
+    """
+    Creates a specified number of binary files of a fixed size in the root directory.
+    With `verbose`, a line is printed for every created file. With `reuse`,
+    random data is generated once and every file gets the same content.
+    With `secure`, content comes from os.urandom instead of NumPy's generator;
+    files of _LARGE_FILE_SIZE or more always come from /dev/urandom.
+    """
+    gens = _generators(secure)
+    
+    file_size_bytes = size_kb * 1024
+    
+    print(f"Creating files in directory: {root_dir}")
+    os.makedirs(root_dir, exist_ok=True)
+
+    stats = {
+        'total_files': 0,
+        'total_size_bytes': 0,
+    }
+
+    # Paths are built by concatenation onto the root prefix (ends with a separator)
+    root_prefix = os.path.join(root_dir, '')
+    file_names = [f"fixed_file_{i:03d}{_EXT_BIN}" for i in range(1, num_files + 1)]
+    file_paths = [root_prefix + file_name for file_name in file_names]
+    size_mb = file_size_bytes / (1024 * 1024)
+
+    # Large files skip the page cache, or at least the extra write() copy
+    large = file_size_bytes >= _LARGE_FILE_SIZE
+
+    # One buffer shared by all files, if requested
+    content = gens[0](file_size_bytes) if reuse else None
+
+    # Files are written in the background; messages are printed here, in order
+    results = _write_files(
+        ((file_path, file_size_bytes, True) for file_path in file_paths),
+        gens, large=large, content=content
+    )
+    try:
+        for file_name, error in zip(file_names, results):
+            if error is not None:
+                _log(f"  Error writing file {file_name}: {error}")
+                continue
+
+            if verbose:
+                _log(f"  Created file: {file_name} (binary, {size_mb:.2f} MB)")
+            
+            # Update stats
+            stats['total_files'] += 1
+            stats['total_size_bytes'] += file_size_bytes
+    finally:
+        _flush_log()
+            
+    return stats
+
+
+def _report_structured(
+    records: Iterable[Tuple[Tuple[str, str, str, int, bool], Optional[IOError]]],
+    counters: "array.array[int]", verbose: bool
+) -> None:
+    """Prints progress for every (task, error) record and updates the counters."""
+    current_subdir = None
+    try:
+        for (subdir_name, file_name, _, file_size, is_binary), error in records:
+            if verbose and subdir_name != current_subdir:
+                _log(f"  Created subdirectory: {subdir_name}")
+                current_subdir = subdir_name
+
+            if error is not None:
+                _log(f"    Error writing file {file_name}: {error}")
+                continue
+
+            if verbose:
+                type_str = "binary" if is_binary else "text"
+                size_kb = file_size / 1024
+                _log(f"    Created file: {file_name} ({type_str}, {size_kb:.2f} KB)")
+
+            # Update stats without branching on the file type
+            b = int(is_binary)
+            counters[_IDX_TOTAL_FILES] += 1
+            counters[_IDX_BIN_FILES] += b
+            counters[_IDX_TXT_FILES] += 1 - b
+            counters[_IDX_TOTAL_SIZE] += file_size
+            counters[_IDX_BIN_SIZE] += b * file_size
+            counters[_IDX_TXT_SIZE] += (1 - b) * file_size
+    finally:
+        _flush_log()
+
+
+def _plan_subdir(
+    root_prefix: str, i: int, sizes: List[int], types: List[bool]
+) -> List[Tuple[str, str, str, int, bool]]:
+    """
+    Creates subdirectory number i and returns a (subdir name, file name,
+    path, size, is_binary) task for each of its files.
+    """
+    # Paths are built by concatenation onto prefixes ending with a separator
+    subdir_name = f"subdir_{i:03d}"
+    subdir_path = root_prefix + subdir_name
+    subdir_prefix = subdir_path + os.sep
+    # The root exists already, so a single mkdir() is enough
+    try:
+        os.mkdir(subdir_path)
+    except FileExistsError:
+        pass
+
+    tasks = []
+    for j, (file_size, is_binary) in enumerate(zip(sizes, types), 1):
+        # Create file name
+        extension = _EXT_BIN if is_binary else _EXT_TXT
+        file_name = f"file_{j:03d}{extension}"
+        tasks.append((subdir_name, file_name, subdir_prefix + file_name, file_size, is_binary))
+    return tasks
+
+
+def _init_worker() -> None:
+    """
+    Process pool initializer. Forked workers inherit the parent's random
+    state and pool contents, so each one reseeds to produce its own data.
+    """
+    global _POOL, _NP_RNG, _NP_CHECKED
+    random.seed()
+    _POOL = _RandPool()
+    # _np_rng() creates a fresh generator on next use
+    _NP_RNG = None
+    _NP_CHECKED = False
+
+
+def _build_subdir(
+    job: Tuple[str, int, int, int, int, str, bool, bool]
+) -> List[Tuple[Tuple[str, str, str, int, bool], Optional[IOError]]]:
+    """
+    Process pool worker: plans, creates and fills one subdirectory.
+    Returns a (task, error) record for each of its files.
+    """
+    root_prefix, i, M, min_size_bytes, max_size_bytes, file_type, aggregate, secure = job
+    _, sizes, types = _plan_files(1, M, min_size_bytes, max_size_bytes, file_type)
+    tasks = _plan_subdir(root_prefix, i, sizes, types)
+    write = _write_bundles if aggregate else _write_files
+    return list(zip(tasks, write((task[2:] for task in tasks), _generators(secure))))
+
+
+def create_structured_files(
+    root_dir: str, N: int, M: int, K: int, file_type: str,
+    min_size_bytes: int = 100, aggregate: bool = False, verbose: bool = False,
+    processes: int = 1, secure: bool = False
+) -> Dict[str, Any]:
+    """
+    Creates the root directory, N subdirectories, and 1..M files in each.
+    With `aggregate`, the files of each subdirectory are stored in a single
+    bundle.tar archive instead. With `verbose`, a line is printed for every
+    created subdirectory and file. With `processes` > 1, subdirectories are
+    built in parallel by that many worker processes. With `secure`, content
+    comes from os.urandom instead of NumPy's generator.
+    Returns statistics about the generated files.
+    """
+    gens = _generators(secure)
+    
+    # Convert K kilobytes to bytes
+    max_size_bytes = K * 1024
+    
+    print(f"Creating structured directory: {root_dir}")
+    os.makedirs(root_dir, exist_ok=True)
+    
+    # Check if minimum size is reasonable
+    if min_size_bytes > max_size_bytes:
+        print(f"Warning: Minimum size ({min_size_bytes}B) is larger than maximum ({max_size_bytes}B). Setting minimum to maximum.")
+        min_size_bytes = max_size_bytes
+
+    # Statistics tracking (64-bit counters, see _STATS_KEYS)
+    counters = array.array('q', [0] * len(_STATS_KEYS))
+        
+    root_prefix = os.path.join(root_dir, '')
+    with contextlib.ExitStack() as stack:
+        if processes > 1:
+            # Each worker process plans, creates and fills whole subdirectories
+            import multiprocessing
+            pool = stack.enter_context(
+                multiprocessing.Pool(processes, initializer=_init_worker)
+            )
+            jobs = [
+                (root_prefix, i, M, min_size_bytes, max_size_bytes, file_type, aggregate, secure)
+                for i in range(1, N + 1)
+            ]
+            records = itertools.chain.from_iterable(pool.imap(_build_subdir, jobs))
+        else:
+            # Plan the whole structure first: (subdir name, file name, path, size, is_binary)
+            tasks = []
+            counts, sizes, types = _plan_files(N, M, min_size_bytes, max_size_bytes, file_type)
+            offset = 0
+            for i, num_files in enumerate(counts, 1):
+                tasks.extend(_plan_subdir(
+                    root_prefix, i, sizes[offset:offset + num_files], types[offset:offset + num_files]
+                ))
+                offset += num_files
+
+            # Generate and write files in the background
+            if aggregate:
+                results = _write_bundles((task[2:] for task in tasks), gens)
+            else:
+                results = _write_files((task[2:] for task in tasks), gens)
+            records = zip(tasks, results)
+
+        # Messages are printed here, in order
+        _report_structured(records, counters, verbose)
+
+    return dict(zip(_STATS_KEYS, counters))
+
+
+def print_structured_statistics(stats: Dict[str, Any]) -> None:
+    """Prints a summary of the generated structured file statistics."""
+    total_files = stats['total_files']
+    
+    if total_files == 0:
+        print("\nNo files were generated.")
+        return
+
+    # Calculate averages
+    avg_total_size = stats['total_size_bytes'] / total_files / 1024 if total_files > 0 else 0
+    
+    binary_files = stats['binary_files']
+    avg_binary_size = stats['binary_size_bytes'] / binary_files / 1024 if binary_files > 0 else 0
+    
+    text_files = stats['text_files']
+    avg_text_size = stats['text_size_bytes'] / text_files / 1024 if text_files > 0 else 0
+
+    # Total sizes in MB
+    total_size_mb = stats['total_size_bytes'] / (1024 * 1024)
+    binary_size_mb = stats['binary_size_bytes'] / (1024 * 1024)
+    text_size_mb = stats['text_size_bytes'] / (1024 * 1024)
+    
+    print("\n--- Structured Generation Statistics ---")
+    print(f"Total files generated: {total_files}")
+    print(f"Total size: {total_size_mb:.2f} MB")
+    print("-" * 30)
+    
+    print(f"Binary files: {binary_files}")
+    print(f"  Total size (Binary): {binary_size_mb:.2f} MB")
+    print(f"  Average size (Binary): {avg_binary_size:.2f} KB")
+    print("-" * 30)
+
+    print(f"Text files: {text_files}")
+    print(f"  Total size (Text): {text_size_mb:.2f} MB")
+    print(f"  Average size (Text): {avg_text_size:.2f} KB")
+    print("-" * 30)
+    
+    
+def print_simple_statistics(stats: Dict[str, Any]) -> None:
+    """Prints a summary for the simple file creation mode."""
+    total_files = stats['total_files']
+    total_size_mb = stats['total_size_bytes'] / (1024 * 1024)
+    avg_size_mb = total_size_mb / total_files if total_files > 0 else 0
+    
+    print("\n--- Simple File Creation Statistics ---")
+    print(f"Total files created: {total_files}")
+    print(f"File type: Binary (Fixed Size)")
+    print(f"Total size: {total_size_mb:.2f} MB")
+    print(f"Average file size: {avg_size_mb:.2f} MB")
+    print("-" * 30)
+
+# ==================================================================================